@@ -92,11 +92,8 @@ def check_filetype(filetype):
     if not opt.check_lengths:
         colnames = ["TIME"]
     else:
-        colnames = [
-            x
-            for x in pickle.load(open(msid_files["colnames"].abs))
-            if x not in fetch.IGNORE_COLNAMES
-        ]
+        with open(msid_files["colnames"].abs, "rb") as fh:
+            colnames = [x for x in pickle.load(fh) if x not in fetch.IGNORE_COLNAMES]
 
     lengths = set()
     for colname in colnames:
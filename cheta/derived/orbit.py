@@ -73,25 +73,15 @@ def calc_orbital_elements(x, y, z, vx, vy, vz):
         :param arg: float, np.ndarray: input arg (radians)
         :param reflect: bool, np.ndarray of bool: use reflected value
         """
-        np_err_handling = np.geterr()
-        np.seterr(all="raise")
-        try:
-            out = arccos(arg)
-        except FloatingPointError:
-            print("Bad argccos arg={}".format(arg))
-            raise
-        np.seterr(**np_err_handling)
-
-        try:
-            # Check if arg has a length
-            len(arg)
-        except TypeError:
-            if reflect:
-                out = 2 * pi - out
-        else:
-            out[reflect] = 2 * pi - out[reflect]
-
-        return out
+        with np.errstate(all="raise"):
+            try:
+                out = arccos(arg)
+            except FloatingPointError:
+                print("Bad argccos arg={}".format(arg))
+                raise
+
+        # Works for both scalar and array inputs
+        return np.where(reflect, 2 * pi - out, out)
 
     # Semi major axis
     r = np.sqrt(x**2 + y**2 + z**2)
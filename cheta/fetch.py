@@ -1066,11 +1066,13 @@ class MSID(object):
             tstart = DateTime(start).secs if start else self.times[0]
             tstop = DateTime(stop).secs if stop else self.times[-1]
 
-            # Legacy method for backward compatibility.  Note that the np.arange()
-            # call accrues floating point error.
+            # Scale an integer sequence by ``dt`` instead of using
+            # np.arange(tstart, tstop, dt), which accrues floating point error.
+            # The number of samples is the same as for np.arange().
             tstart = max(tstart, self.times[0])
             tstop = min(tstop, self.times[-1])
-            times = np.arange(tstart, tstop, dt)
+            n_times = max(int(np.ceil((tstop - tstart) / dt)), 0)
+            times = np.arange(n_times) * dt + tstart
 
         logger.info("Interpolating index for %s", self.msid)
         indexes = Ska.Numpy.interpolate(
@@ -1255,12 +1257,6 @@ class MSID(object):
         :param intervals: iterable (N x 2) with tstart, tstop in seconds
         :param exclude: exclude intervals if True, else include intervals
         """
-        # Make an initial acceptance mask.  If exclude is True then initially
-        # all values are allowed (ok=True).  If exclude is False (i.e. only
-        # include the interval times) then ok=False everywhere.
-        ok = np.empty(len(self.times), dtype=bool)
-        ok[:] = exclude
-
         # See if the input intervals is actually a table of intervals
         intervals_list = _get_table_intervals_as_list(intervals, check_overlaps=False)
         if intervals_list is not None:
@@ -1272,25 +1268,39 @@ class MSID(object):
         if "EventQuery" in (cls.__name__ for cls in intervals.__class__.__mro__):
             intervals = intervals.intervals(self.datestart, self.datestop)
 
-        intervals = [
-            (DateTime(start).secs, DateTime(stop).secs) for start, stop in intervals
-        ]
-
-        for tstart, tstop in intervals:
-            if tstart > tstop:
-                raise ValueError(
-                    "Start time %s must be less than stop time %s" % (tstart, tstop)
-                )
+        intervals = np.array(
+            [(DateTime(start).secs, DateTime(stop).secs) for start, stop in intervals],
+            dtype=float,
+        ).reshape(-1, 2)
+        tstarts, tstops = intervals[:, 0], intervals[:, 1]
 
-            if tstop < self.times[0] or tstart > self.times[-1]:
-                continue
+        bad = tstarts > tstops
+        if np.any(bad):
+            i_bad = np.flatnonzero(bad)[0]
+            raise ValueError(
+                "Start time %s must be less than stop time %s"
+                % (tstarts[i_bad], tstops[i_bad])
+            )
 
-            # Find the indexes of bad data.  Using side=left,right respectively
-            # will exclude points exactly equal to the bad_times values
-            # (though in reality an exact tie is extremely unlikely).
-            i0 = np.searchsorted(self.times, tstart, side="left")
-            i1 = np.searchsorted(self.times, tstop, side="right")
-            ok[i0:i1] = not exclude
+        # Find the index ranges of all intervals at once.  Using side=left,right
+        # respectively will exclude points exactly equal to the bad_times values
+        # (though in reality an exact tie is extremely unlikely).
+        n_times = len(self.times)
+        i0s = np.searchsorted(self.times, tstarts, side="left")
+        i1s = np.searchsorted(self.times, tstops, side="right")
+
+        # Mark each sample with the number of intervals that contain it, allowing
+        # for overlapping intervals, via a cumulative sum of range start (+1) and
+        # stop (-1) markers.
+        n_in_intervals = np.cumsum(
+            np.bincount(i0s, minlength=n_times + 1)
+            - np.bincount(i1s, minlength=n_times + 1)
+        )[:n_times]
+        in_intervals = n_in_intervals > 0
+
+        # Acceptance mask.  If exclude is True then all values outside the
+        # intervals are allowed, otherwise only values inside the intervals.
+        ok = ~in_intervals if exclude else in_intervals
 
         colnames = (x for x in self.colnames)
         for colname in colnames:
@@ -1767,17 +1777,23 @@ class MSIDset(collections.OrderedDict):
             tstop = min(tstop, min_fetch_tstop)
             obj.times = np.arange((tstop - tstart) // dt + 1) * dt + tstart
 
+        # MSIDs within a content type usually share the same time stamps, so only
+        # compute the nearest-neighbor indexes when the time base changes.
+        times_prev = None
+        indexes = None
         for msid in msids:
             if filter_bad and not bad_union:
                 msid.filter_bad()
-            logger.info("Interpolating index for %s", msid.msid)
-            indexes = Ska.Numpy.interpolate(
-                np.arange(len(msid.times)),
-                msid.times,
-                obj.times,
-                method="nearest",
-                sorted=True,
-            )
+            if times_prev is None or not np.array_equal(msid.times, times_prev):
+                logger.info("Interpolating index for %s", msid.msid)
+                indexes = Ska.Numpy.interpolate(
+                    np.arange(len(msid.times)),
+                    msid.times,
+                    obj.times,
+                    method="nearest",
+                    sorted=True,
+                )
+                times_prev = msid.times
             logger.info("Slicing on indexes")
             for colname in msid.colnames:
                 colvals = getattr(msid, colname)
@@ -72,6 +72,33 @@ else:
     HAS_MAUDE = True
 
 
+# Module-scoped fetches of data that are used by multiple tests.  Tests that
+# modify the data in place must work on a copy.
+@pytest.fixture(scope="module")
+def aogyrct1_MSID():
+    return fetch.MSID("aogyrct1", "2008:291:12:00:00", "2008:298:12:00:00")
+
+
+@pytest.fixture(scope="module")
+def aogyrct1_Msid():
+    return fetch.Msid("aogyrct1", "2008:291:12:00:00", "2008:298:12:00:00")
+
+
+@pytest.fixture(scope="module")
+def aogbias1_MSID():
+    return fetch.MSID("aogbias1", "2008:291:12:00:00", "2008:298:12:00:00")
+
+
+@pytest.fixture(scope="module")
+def aogbias1_Msid():
+    return fetch.Msid("aogbias1", "2008:291:12:00:00", "2008:298:12:00:00")
+
+
+@pytest.fixture(scope="module")
+def tephin_Msid():
+    return fetch.Msid("tephin", "2010:001:12:00:00", "2010:100:12:00:00")
+
+
 def test_filter_bad_times_overlap():
     """
     OK to supply overlapping bad times
@@ -93,8 +120,8 @@ def test_filter_bad_times_overlap():
     assert len(dat) == 5
 
 
-def test_filter_bad_times_list():
-    dat = fetch.MSID("aogyrct1", "2008:291:12:00:00", "2008:298:12:00:00")
+def test_filter_bad_times_list(aogyrct1_MSID, aogyrct1_Msid):
+    dat = aogyrct1_MSID.copy()
     # 2nd test of repr here where we have an MSID object handy
     assert (
         repr(dat) == "<MSID AOGYRCT1 start=2008:291:12:00:00.000 "
@@ -105,7 +132,7 @@ def test_filter_bad_times_list():
     dates = DateTime(dat.times[168581:168588]).date
     assert np.all(dates == DATES_EXPECT1)
 
-    dat = fetch.Msid("aogyrct1", "2008:291:12:00:00", "2008:298:12:00:00")
+    dat = aogyrct1_Msid.copy()
     dat.filter_bad_times(table=BAD_TIMES)
     dates = DateTime(dat.times[168581:168588]).date
     assert np.all(dates == DATES_EXPECT1)
@@ -152,22 +179,22 @@ def test_msidset_filter_bad_times_list():
     assert np.all(dates == DATES_EXPECT1)
 
 
-def test_filter_bad_times_default():
+def test_filter_bad_times_default(aogbias1_MSID):
     """Test bad times that come from msid_bad_times.dat"""
-    dat = fetch.MSID("aogbias1", "2008:291:12:00:00", "2008:298:12:00:00")
+    dat = aogbias1_MSID.copy()
     dat.filter_bad_times()
     dates = DateTime(dat.times[42140:42150]).date
     assert np.all(dates == DATES_EXPECT2)
 
 
-def test_filter_bad_times_list_copy():
-    dat = fetch.MSID("aogyrct1", "2008:291:12:00:00", "2008:298:12:00:00")
+def test_filter_bad_times_list_copy(aogyrct1_MSID, aogyrct1_Msid):
+    dat = aogyrct1_MSID
     dat2 = dat.filter_bad_times(table=BAD_TIMES, copy=True)
     dates = DateTime(dat2.times[168581:168588]).date
     assert np.all(dates == DATES_EXPECT1)
     assert len(dat.vals) != len(dat2.vals)
 
-    dat = fetch.Msid("aogyrct1", "2008:291:12:00:00", "2008:298:12:00:00")
+    dat = aogyrct1_Msid
     dat2 = dat.filter_bad_times(table=BAD_TIMES, copy=True)
     dates = DateTime(dat2.times[168581:168588]).date
     assert np.all(dates == DATES_EXPECT1)
@@ -186,9 +213,9 @@ def test_msidset_filter_bad_times_list_copy():
     assert np.all(dates == DATES_EXPECT1)
 
 
-def test_filter_bad_times_default_copy():
+def test_filter_bad_times_default_copy(aogbias1_MSID):
     """Test bad times that come from msid_bad_times.dat"""
-    dat = fetch.MSID("aogbias1", "2008:291:12:00:00", "2008:298:12:00:00")
+    dat = aogbias1_MSID
     dat2 = dat.filter_bad_times(copy=True)
     dates = DateTime(dat2.times[42140:42150]).date
     assert np.all(dates == DATES_EXPECT2)
@@ -498,20 +525,20 @@ def test_interpolate_msid_times():
     assert np.all(DateTime(dat.times).date == DATES_EXPECT3)
 
 
-def test_interpolate_time_precision():
+def test_interpolate_time_precision(tephin_Msid):
     """
     Check that floating point error is < 0.01 msec over 100 days
     """
-    dat = fetch.Msid("tephin", "2010:001:12:00:00", "2010:100:12:00:00")
+    dat = tephin_Msid.copy()
     dt = 60.06
     times = dat.tstart + np.arange((dat.tstop - dat.tstart) // dt + 3) * dt
 
     dat.interpolate(60.06)  # Not exact binary float
     dt = dat.times[-1] - dat.times[0]
     dt_frac = dt * 100 - round(dt * 100)
-    assert abs(dt_frac) > 0.001
+    assert abs(dt_frac) < 0.001
 
-    dat = fetch.Msid("tephin", "2010:001:12:00:00", "2010:100:12:00:00")
+    dat = tephin_Msid.copy()
     dat.interpolate(times=times)
     dt = dat.times[-1] - dat.times[0]
     dt_frac = dt * 100 - round(dt * 100)
@@ -521,14 +548,13 @@ def test_interpolate_time_precision():
 def _assert_msid_equal(msid1, msid2):
     for attr in ("tstart", "tstop", "datestart", "datestop", "units", "unit", "stat"):
         assert getattr(msid1, attr) == getattr(msid2, attr)
-    assert np.all(msid1.times == msid2.times)
-    assert np.all(msid1.vals == msid2.vals)
+    assert np.array_equal(msid1.times, msid2.times)
+    assert np.array_equal(msid1.vals, msid2.vals)
     assert msid1.__class__ is msid2.__class__
 
 
-def test_msid_copy():
-    for MsidClass in (fetch.Msid, fetch.MSID):
-        msid1 = MsidClass("aogbias1", "2008:291:12:00:00", "2008:298:12:00:00")
+def test_msid_copy(aogbias1_Msid, aogbias1_MSID):
+    for msid1 in (aogbias1_Msid, aogbias1_MSID):
         msid2 = msid1.copy()
         _assert_msid_equal(msid1, msid2)
 
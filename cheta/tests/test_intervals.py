@@ -1,16 +1,32 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import functools
+
 import numpy as np
 import pytest
 from Chandra.Time import DateTime
 
 from .. import fetch, utils
 
-try:
-    import kadi.events
 
-    HAS_EVENTS = True
-except ImportError:
-    HAS_EVENTS = False
+@pytest.fixture(scope="module")
+def events():
+    # Importing kadi.events is slow (django setup), so defer it until a test
+    # needs it and skip those tests if it is not available.
+    return pytest.importorskip("kadi.events")
+
+
+@pytest.fixture(scope="module")
+def dwell_intervals(events):
+    """Cached ``events.dwells.intervals(start, stop)``.  Tests must not modify
+    the returned table."""
+    return functools.lru_cache(maxsize=32)(events.dwells.intervals)
+
+
+@pytest.fixture(scope="module")
+def aopcadmd_Msid():
+    """AOPCADMD for 2013:001 00:00 to 02:00, shared by read-only interval tests."""
+    return fetch.Msid("aopcadmd", "2013:001:00:00:00", "2013:001:02:00:00")
+
 
 # Use dwells for some interval filter tests
 #
@@ -31,34 +47,34 @@ except ImportError:
 #  ('2012:002:10:38:21.218', '2012:002:12:00:00.000')]
 
 
-@pytest.mark.skipif("not HAS_EVENTS")
-def test_fetch_MSID_intervals():
+@pytest.mark.parametrize("filter_bad", [True, False])
+@pytest.mark.parametrize("stat", [None, "5min"])
+def test_fetch_MSID_intervals(events, dwell_intervals, filter_bad, stat):
     """
     Show that fetching an MSID with start=<some intervals> is exactly the same as
     fetching over the time range and selecting <some intervals>.
     """
     # Interval with a bad quality point around 2012:175:02:10:021.981
     start, stop = "2012:175:02:00:00", "2012:175:03:00:00"
-    for filter_bad in (True, False):
-        for stat in (None, "5min"):
-            dat = fetch.MSID("tephin", start, stop, filter_bad=filter_bad, stat=stat)
-            dat.select_intervals(kadi.events.dwells)
-
-            dat2 = fetch.MSID(
-                "tephin",
-                kadi.events.dwells.intervals(start, stop),
-                filter_bad=filter_bad,
-                stat=stat,
-            )
-
-            assert np.all(dat.bads == dat2.bads)
-            assert dat.colnames == dat2.colnames
-            for attr in dat.colnames:
-                assert np.all(getattr(dat, attr) == getattr(dat2, attr))
-
-
-@pytest.mark.skipif("not HAS_EVENTS")
-def test_fetch_MSIDset_intervals():
+    dat = fetch.MSID("tephin", start, stop, filter_bad=filter_bad, stat=stat)
+    dat.select_intervals(events.dwells)
+
+    dat2 = fetch.MSID(
+        "tephin",
+        dwell_intervals(start, stop),
+        filter_bad=filter_bad,
+        stat=stat,
+    )
+
+    assert np.array_equal(dat.bads, dat2.bads)
+    assert dat.colnames == dat2.colnames
+    for attr in dat.colnames:
+        assert np.array_equal(getattr(dat, attr), getattr(dat2, attr))
+
+
+@pytest.mark.parametrize("filter_bad", [True, False])
+@pytest.mark.parametrize("stat", [None, "5min"])
+def test_fetch_MSIDset_intervals(events, dwell_intervals, filter_bad, stat):
     """
     Show that fetching an MSIDset with start=<some intervals> is exactly the same as
     fetching over the time range and selecting <some intervals>.
@@ -66,30 +82,27 @@ def test_fetch_MSIDset_intervals():
     # Interval with a bad quality point around 2012:175:02:10:021.981
     start, stop = "2012:175:02:00:00", "2012:175:03:00:00"
     msids = ["tephin", "aopcadmd"]
-    for filter_bad in (True, False):
-        for stat in (None, "5min"):
-            dat = fetch.MSIDset(msids, start, stop, filter_bad=filter_bad, stat=stat)
-            for msid in msids:
-                dat[msid].select_intervals(kadi.events.dwells)
-
-            dat2 = fetch.MSIDset(
-                msids,
-                kadi.events.dwells.intervals(start, stop),
-                filter_bad=filter_bad,
-                stat=stat,
-            )
-
-            for msid in msids:
-                dm = dat[msid]
-                dm2 = dat2[msid]
-                assert np.all(dm.bads == dm2.bads)
-                assert dm.colnames == dm2.colnames
-                for attr in dm.colnames:
-                    assert np.all(getattr(dm, attr) == getattr(dm2, attr))
-
-
-@pytest.mark.skipif("not HAS_EVENTS")
-def test_select_remove_interval():
+    dat = fetch.MSIDset(msids, start, stop, filter_bad=filter_bad, stat=stat)
+    for msid in msids:
+        dat[msid].select_intervals(events.dwells)
+
+    dat2 = fetch.MSIDset(
+        msids,
+        dwell_intervals(start, stop),
+        filter_bad=filter_bad,
+        stat=stat,
+    )
+
+    for msid in msids:
+        dm = dat[msid]
+        dm2 = dat2[msid]
+        assert np.array_equal(dm.bads, dm2.bads)
+        assert dm.colnames == dm2.colnames
+        for attr in dm.colnames:
+            assert np.array_equal(getattr(dm, attr), getattr(dm2, attr))
+
+
+def test_select_remove_interval(events, dwell_intervals):
     """
     Test basic select and remove intervals functionality.  Do this with two
     inputs: (1) a QueryEvent object, (2) a table with 'datestart' and 'datestop' cols.
@@ -98,28 +111,28 @@ def test_select_remove_interval():
     """
     start, stop = "2012:002:02:00:00", "2012:002:04:00:00"
     dat = fetch.MSID("tephin", start, stop)
-    intervals = kadi.events.dwells.intervals(start, stop)
-    for filt in (kadi.events.dwells, intervals):
+    intervals = dwell_intervals(start, stop)
+    for filt in (events.dwells, intervals):
         dat_r = dat.remove_intervals(filt, copy=True)
         dat_s = dat.select_intervals(filt, copy=True)
         assert len(dat) == len(dat_r) + len(dat_s)
         assert len(dat) == 219
         assert len(dat_r) == 51
         assert len(dat_s) == 168
-        dates_r = DateTime(dat_r.times).date
+        # Only convert the probed samples to dates
+        dates_r = DateTime(dat_r.times[[0, 15, 16, 50]]).date
         assert (
             dates_r[0] == "2012:002:02:49:39.317"
         )  # First after '2012:002:02:49:27.017'
-        assert dates_r[15] == "2012:002:02:57:51.317"  # Gap '2012:002:02:58:11.817'
-        assert dates_r[16] == "2012:002:03:04:57.717"  # to '2012:002:03:04:39.267'
+        assert dates_r[1] == "2012:002:02:57:51.317"  # Gap '2012:002:02:58:11.817'
+        assert dates_r[2] == "2012:002:03:04:57.717"  # to '2012:002:03:04:39.267'
         assert (
-            dates_r[50] == "2012:002:03:23:32.917"
+            dates_r[3] == "2012:002:03:23:32.917"
         )  # last before '2012:002:03:23:45.217'
-        assert set(dat_r.times).isdisjoint(dat_s.times)
+        assert np.intersect1d(dat_r.times, dat_s.times, assume_unique=True).size == 0
 
 
-@pytest.mark.skipif("not HAS_EVENTS")
-def test_remove_subclassed_eventquery_interval():
+def test_remove_subclassed_eventquery_interval(events):
     """
     Test remove intervals functionality with an EventQuery subclass
     (LttBadsEventQuery).
@@ -127,16 +140,15 @@ def test_remove_subclassed_eventquery_interval():
     start, stop = "2010:002:02:00:00", "2013:002:04:00:00"
     dat = fetch.MSID("tephin", start, stop, stat="daily")
     assert len(dat) == 1096
-    dat.remove_intervals(kadi.events.ltt_bads)
+    dat.remove_intervals(events.ltt_bads)
     assert len(dat) == 1026
 
 
-@pytest.mark.skipif("not HAS_EVENTS")
-def test_remove_intervals_stat():
+def test_remove_intervals_stat(events, dwell_intervals):
     start, stop = "2012:002:12:00:00", "2012:003:12:00:00"
+    intervals = dwell_intervals(start, stop)
     for stat in (None, "5min"):
-        intervals = kadi.events.dwells.intervals(start, stop)
-        for filt in (kadi.events.dwells, intervals):
+        for filt in (events.dwells, intervals):
             dat = fetch.MSID("tephin", start, stop)
             dat.remove_intervals(filt)
             attrs = [
@@ -162,24 +174,49 @@ def test_remove_intervals_stat():
             assert len(dat) == len(getattr(dat, attr))
 
 
-@pytest.mark.skipif("not HAS_EVENTS")
-def test_select_remove_all_interval():
+def test_select_remove_all_interval(events):
     """
     Select or remove all data points via an event that entirely spans the MSID data.
     """
     dat = fetch.Msid("tephin", "2012:001:20:00:00", "2012:001:21:00:00")
-    dat_r = dat.remove_intervals(kadi.events.dwells, copy=True)
-    dat_s = dat.select_intervals(kadi.events.dwells, copy=True)
+    dat_r = dat.remove_intervals(events.dwells, copy=True)
+    dat_s = dat.select_intervals(events.dwells, copy=True)
     assert len(dat) == 110
     assert len(dat_r) == 0
     assert len(dat_s) == 110
 
 
-def test_msid_logical_intervals():
+def test_select_remove_overlapping_intervals():
+    """
+    Overlapping intervals filter the same points as their union.
+    """
+    dat = fetch.Msid("tephin", "2012:001:00:00:00", "2012:002:00:00:00")
+    overlapping = [
+        ("2012:001:02:00:00", "2012:001:06:00:00"),
+        ("2012:001:04:00:00", "2012:001:08:00:00"),
+        ("2012:001:05:00:00", "2012:001:05:30:00"),
+        ("2012:001:20:00:00", "2012:001:21:00:00"),
+    ]
+    union = [
+        ("2012:001:02:00:00", "2012:001:08:00:00"),
+        ("2012:001:20:00:00", "2012:001:21:00:00"),
+    ]
+    for method in ("remove_intervals", "select_intervals"):
+        dat_o = getattr(dat, method)(overlapping, copy=True)
+        dat_u = getattr(dat, method)(union, copy=True)
+        assert 0 < len(dat_o) < len(dat)
+        assert np.array_equal(dat_o.times, dat_u.times)
+        assert np.array_equal(dat_o.vals, dat_u.vals)
+
+    with pytest.raises(ValueError, match="must be less than stop time"):
+        dat.remove_intervals([("2012:001:02:00:00", "2012:001:01:00:00")], copy=True)
+
+
+def test_msid_logical_intervals(aopcadmd_Msid):
     """
     Test MSID.logical_intervals()
     """
-    dat = fetch.Msid("aopcadmd", "2013:001:00:00:00", "2013:001:02:00:00")
+    dat = aopcadmd_Msid
 
     intervals = dat.logical_intervals("==", "NPNT", complete_intervals=True)
     assert len(intervals) == 1
@@ -239,7 +276,19 @@ def test_util_logical_intervals_gap():
     assert np.allclose(out["tstop"], [202.5])
 
 
-def test_msid_state_intervals():
+def test_util_logical_intervals_multiple_gaps():
+    """
+    Test the max_gap functionality with several gaps, including a gap next to
+    a False value.
+    """
+    times = np.array([1, 2, 3, 200, 201, 202, 400, 401, 600])
+    bools = np.array([1, 1, 1, 1, 0, 1, 1, 1, 1], dtype=bool)
+    out = utils.logical_intervals(times, bools, max_gap=10)
+    assert np.allclose(out["tstart"], [0.5, 197.5, 201.5, 397.5, 597.5])
+    assert np.allclose(out["tstop"], [5.5, 200.5, 204.5, 403.5, 602.5])
+
+
+def test_msid_state_intervals(aopcadmd_Msid):
     """
     Test MSID.state_intervals() - basic aliveness and regression test
     """
@@ -253,7 +302,7 @@ def test_msid_state_intervals():
         "2013:001:01:59:06.233 2013:001:01:59:59.533 NPNT",
     ]
 
-    dat = fetch.Msid("aopcadmd", "2013:001:00:00:00", "2013:001:02:00:00")
+    dat = aopcadmd_Msid
     intervals = dat.state_intervals()["datestart", "datestop", "val"]
     assert intervals.pformat() == expected
 
@@ -34,3 +34,25 @@ def test_orbital_elements():
 
     for key in expected:
         assert np.allclose(out[key], expected[key], atol=0.0, rtol=1e-6)
+
+
+def test_orbital_elements_arrays():
+    """
+    Test that arrays of state vectors give the same elements as scalar inputs
+    """
+    x, y, z = 5052.4587e3, 1056.2713e3, 5011.6366e3
+    vx, vy, vz = 3.8589872e3, 4.2763114e3, -4.8070493e3
+
+    # Second state vector is reflected through the x-z plane
+    ones = np.array([1.0, 1.0])
+    sign = np.array([1.0, -1.0])
+    out = orbit.calc_orbital_elements(
+        x * ones, y * sign, z * ones, vx * ones, vy * sign, vz * ones
+    )
+
+    for idx in range(2):
+        out_scalar = orbit.calc_orbital_elements(
+            x, y * sign[idx], z, vx, vy * sign[idx], vz
+        )
+        for key, val in out_scalar.items():
+            assert np.allclose(out[key][idx], val, atol=0.0, rtol=1e-12)
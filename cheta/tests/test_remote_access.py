@@ -72,7 +72,6 @@ installation root directory (`python -c 'import sys; print(sys.prefix)'`) as
 """
 
 import os
-import shutil
 from pathlib import Path
 
 import pytest
@@ -94,26 +93,32 @@ def setenv(name, val):
         os.environ.pop(name, None)
 
 
-@pytest.fixture()
-def remote_setup_dirs(tmpdir):
+@pytest.fixture(scope="module")
+def remote_setup_dirs(tmp_path_factory):
     """
     Pytest fixture to provide temporary mock Ska eng archive data
-    directory structure.
+    directory structure.  The tests only read this, so it is made once
+    per module.
 
-    :param tmpdir: temp directory supplied by pytest
+    :param tmp_path_factory: temp directory factory supplied by pytest
     """
-    ska_dir = Path(tmpdir)
+    ska_dir = tmp_path_factory.mktemp("ska")
     eng_archive_dir = ska_dir / "data" / "eng_archive"
     (eng_archive_dir / "data").mkdir(parents=True)
 
-    yield (ska_dir, eng_archive_dir)
+    return (ska_dir, eng_archive_dir)
+
+
+@pytest.fixture(autouse=True)
+def restore_env():
+    """
+    Pytest fixture to return the environment to original after each test.
+    """
+    yield
 
-    # Teardown: return environment to original
     for name in "SKA", "ENG_ARCHIVE", "SKA_ACCESS_REMOTELY":
         setenv(name, ORIG_ENV[name])
 
-    shutil.rmtree(tmpdir)
-
 
 def test_remote_access_get_data_access_info1(remote_setup_dirs):
     """
@@ -141,13 +146,14 @@ def test_remote_access_get_data_access_info2(remote_setup_dirs):
     Just SKA set to a valid directory (typical case on linux/mac)
     """
     ska_dir, eng_archive_dir = remote_setup_dirs
+    eng_archive_abs = str(eng_archive_dir.absolute())
 
     setenv("SKA", ska_dir)
     setenv("ENG_ARCHIVE", None)  # I.e. not set
     setenv("SKA_ACCESS_REMOTELY", None)
     for is_windows in True, False:
         eng_archive, ska_access_remotely = get_data_access_info(is_windows)
-        assert eng_archive == str(eng_archive_dir.absolute())
+        assert eng_archive == eng_archive_abs
         assert ska_access_remotely is False
 
 
@@ -157,6 +163,7 @@ def test_remote_access_get_data_access_info3(remote_setup_dirs):
     SKA either unset or set to a bad directory
     """
     ska_dir, eng_archive_dir = remote_setup_dirs
+    eng_archive_abs = str(eng_archive_dir.absolute())
 
     for ska_env in None, INVALID_DIR:
         setenv("SKA", ska_env)
@@ -164,7 +171,7 @@ def test_remote_access_get_data_access_info3(remote_setup_dirs):
         setenv("SKA_ACCESS_REMOTELY", None)
         for is_windows in True, False:
             eng_archive, ska_access_remotely = get_data_access_info(is_windows)
-            assert eng_archive == str(eng_archive_dir.absolute())
+            assert eng_archive == eng_archive_abs
             assert ska_access_remotely is False
 
 
@@ -1,3 +1,4 @@
+import bisect
 import os
 import pickle
 import shutil
@@ -32,6 +33,13 @@ CONTENTS = {
 
 LOG_LEVEL = 50  # quiet
 
+# Max number of rows of fill values to write at once when padding stub files
+FILL_CHUNK_ROWS = 100_000
+
+# Stub files are temporary scaffolding, so favor write speed over compression
+# ratio.  Blosc is bundled with PyTables.
+STUB_FILTERS = tables.Filters(complevel=5, complib="blosc", shuffle=True)
+
 
 def make_linked_local_archive(outdir, content, msids):
     """
@@ -56,34 +64,34 @@ def make_linked_local_archive(outdir, content, msids):
     (basedir_out / content).mkdir(parents=True)
     (basedir_out / content / "5min").mkdir()
     (basedir_out / content / "daily").mkdir()
-    for file in "archfiles.db3", "colnames.pickle", "TIME.h5":
+    for file in "archfiles.db3", "colnames.pickle":
         shutil.copy(basedir_in / content / file, basedir_out / content / file)
+
+    # Data files are only read, so link instead of copying.  This includes
+    # TIME.h5, which can be large.
+    files = [Path(content) / "TIME.h5"]
     for msid in msids:
         file = f"{msid}.h5"
+        files.extend(Path(content) / subdir / file for subdir in ("", "5min", "daily"))
+    for file in files:
         try:
-            os.link(basedir_in / content / file, basedir_out / content / file)
-        except OSError:
-            os.symlink(basedir_in / content / file, basedir_out / content / file)
-        try:
-            os.link(
-                basedir_in / content / "5min" / file,
-                basedir_out / content / "5min" / file,
-            )
-        except OSError:
-            os.symlink(
-                basedir_in / content / "5min" / file,
-                basedir_out / content / "5min" / file,
-            )
-        try:
-            os.link(
-                basedir_in / content / "daily" / file,
-                basedir_out / content / "daily" / file,
-            )
+            os.link(basedir_in / file, basedir_out / file)
         except OSError:
-            os.symlink(
-                basedir_in / content / "daily" / file,
-                basedir_out / content / "daily" / file,
-            )
+            os.symlink(basedir_in / file, basedir_out / file)
+
+
+def append_fill(node, n_rows, dtype, fill_value=0):
+    """
+    Append ``n_rows`` rows of ``fill_value`` to HDF5 table or array ``node``.
+
+    This is done in chunks of ``FILL_CHUNK_ROWS`` so that padding the start of
+    a stub file does not require a full archive length array in memory.
+    """
+    chunk = np.zeros(min(n_rows, FILL_CHUNK_ROWS), dtype=dtype)
+    if fill_value:
+        chunk[:] = fill_value
+    for idx0 in range(0, n_rows, FILL_CHUNK_ROWS):
+        node.append(chunk[: n_rows - idx0])
 
 
 def make_sync_repo(outdir, content):
@@ -119,8 +127,9 @@ def make_stub_archfiles(date, basedir_ref, basedir_stub):
         # Last archfile that starts before date.
         last_row = db.fetchone(
             "select * from archfiles "
-            f"where filetime < {filetime} "
-            "order by filetime desc"
+            "where filetime < ? "
+            "order by filetime desc limit 1",
+            (filetime,),
         )
 
     with set_fetch_basedir(basedir_stub):
@@ -136,14 +145,23 @@ def make_stub_archfiles(date, basedir_ref, basedir_stub):
     return last_row["rowstart"], last_row["rowstop"]
 
 
-def make_stub_stats_col(msid, stat, row1, basedir_ref, basedir_stub, date_stop):
-    # Max allowed tstop.
-    tstop = DateTime(date_stop).secs
-
+def get_stub_time_last(row1, basedir_ref):
+    """
+    Get the time of the last full-resolution row (``row1 - 1``) in the stub.
+    """
     with set_fetch_basedir(basedir_ref):
         fetch.ft["msid"] = "TIME"
         file_time = fetch.msid_files["msid"].abs
 
+    with tables.open_file(file_time, "r") as h5:
+        return h5.root.data[row1 - 1]
+
+
+def make_stub_stats_col(msid, stat, time_last, basedir_ref, basedir_stub, date_stop):
+    # Max allowed tstop.
+    tstop = DateTime(date_stop).secs
+
+    with set_fetch_basedir(basedir_ref):
         fetch.ft["msid"] = msid
         fetch.ft["interval"] = stat
         file_stats_ref = fetch.msid_files["stats"].abs
@@ -154,36 +172,44 @@ def make_stub_stats_col(msid, stat, row1, basedir_ref, basedir_stub, date_stop):
     with set_fetch_basedir(basedir_stub):
         file_stats_stub = fetch.msid_files["stats"].abs
 
-    with tables.open_file(file_time, "r") as h5:
-        # Pad out tstop by DT in order to be sure that all records before a long
-        # gap get found.  This comes into play for pcad13eng which is in PCAD subformat only.
-        # In addition, do not select data beyond tstop (date_stop), which is the
-        # stub file end time.  This is mostly for ephemeris data, where one archfile covers
-        # many weeks (6?) of data.
-        tstop = min(h5.root.data[row1 - 1] + STATS_DT[stat], tstop)
-        # Need at least 10 days of real values in stub file to start sync
-        tstart = tstop - 10 * 86400
+    # Pad out tstop by DT in order to be sure that all records before a long
+    # gap get found.  This comes into play for pcad13eng which is in PCAD subformat only.
+    # In addition, do not select data beyond tstop (date_stop), which is the
+    # stub file end time.  This is mostly for ephemeris data, where one archfile covers
+    # many weeks (6?) of data.
+    tstop = min(time_last + STATS_DT[stat], tstop)
+    # Need at least 10 days of real values in stub file to start sync
+    tstart = tstop - 10 * 86400
 
     with tables.open_file(file_stats_ref, "r") as h5:
         tbl = h5.root.data
-        times = (tbl.col("index") + 0.5) * STATS_DT[stat]
-        stat_row0, stat_row1 = np.searchsorted(times, [tstart, tstop])
+        # The index column is sorted, so binary search it on disk instead of
+        # reading the whole column (millions of rows for 5min stats).
+        stat_row0, stat_row1 = (
+            bisect.bisect_left(
+                tbl.cols.index, time, key=lambda index: (index + 0.5) * STATS_DT[stat]
+            )
+            for time in (tstart, tstop)
+        )
         # Back up a bit to ensure getting something since an MSID that is not
         # typically sampled (because of subformat for instance) may show up
         # in full data with quality=True everywhere
         # and thus have no stats samples.
         stat_row0 -= 5
-        tbl_rows = np.zeros(stat_row1, dtype=tbl.dtype)
-        tbl_rows[stat_row0:stat_row1] = tbl[stat_row0:stat_row1]
+        tbl_rows = tbl[stat_row0:stat_row1]
         # returns np.ndarray (structured array)
+        n_rows = len(tbl)
 
     Path(file_stats_stub).parent.mkdir(exist_ok=True, parents=True)
 
-    filters = tables.Filters(complevel=5, complib="zlib")
-    with tables.open_file(file_stats_stub, mode="a", filters=filters) as stats:
+    # Rows before stat_row0 are zero-filled so that row indexes in the stub
+    # match the reference archive.
+    with tables.open_file(file_stats_stub, mode="a", filters=STUB_FILTERS) as stats:
         stats.create_table(
-            stats.root, "data", tbl_rows, f"{stat} sampling", expectedrows=1e5
+            stats.root, "data", tbl_rows.dtype, f"{stat} sampling", expectedrows=n_rows
         )
+        append_fill(stats.root.data, stat_row0, tbl_rows.dtype)
+        stats.root.data.append(tbl_rows)
         stats.root.data.flush()
 
 
@@ -201,17 +227,13 @@ def make_stub_h5_col(msid, row0, row1, basedir_ref, basedir_stub):
         qual_stub = h5.root.quality[row0:row1]
         n_rows = len(h5.root.data)
 
-    data_fill = np.zeros(row0, dtype=data_stub.dtype)
-    qual_fill = np.ones(row0, dtype=qual_stub.dtype)  # True => bad
-
     with set_fetch_basedir(basedir_stub):
         file_stub = fetch.msid_files["data"].abs
 
     if os.path.exists(file_stub):
         os.unlink(file_stub)
 
-    filters = tables.Filters(complevel=5, complib="zlib")
-    with tables.open_file(file_stub, mode="w", filters=filters) as h5:
+    with tables.open_file(file_stub, mode="w", filters=STUB_FILTERS) as h5:
         h5shape = (0,) + data_stub.shape[1:]
         h5type = tables.Atom.from_dtype(data_stub.dtype)
         h5.create_earray(
@@ -227,9 +249,9 @@ def make_stub_h5_col(msid, row0, row1, basedir_ref, basedir_stub):
         )
 
     with tables.open_file(file_stub, mode="a") as h5:
-        h5.root.data.append(data_fill)
+        append_fill(h5.root.data, row0, data_stub.dtype)
         h5.root.data.append(data_stub)
-        h5.root.quality.append(qual_fill)
+        append_fill(h5.root.quality, row0, qual_stub.dtype, True)  # True => bad
         h5.root.quality.append(qual_stub)
 
 
@@ -295,16 +317,20 @@ def make_stub_content(
     for msid in msids:
         make_stub_h5_col(msid, row0, row1, basedir_ref, basedir_stub)
 
+    # Read the last stub time once for all the stats columns
+    time_last = get_stub_time_last(row1, basedir_ref)
+
     for msid in msids_5min:
-        make_stub_stats_col(msid, "5min", row1, basedir_ref, basedir_stub, date)
+        make_stub_stats_col(msid, "5min", time_last, basedir_ref, basedir_stub, date)
 
     for msid in msids_daily:
-        make_stub_stats_col(msid, "daily", row1, basedir_ref, basedir_stub, date)
+        make_stub_stats_col(msid, "daily", time_last, basedir_ref, basedir_stub, date)
 
 
 def check_content(outdir, content, msids=None):
     outdir = Path(outdir)
-    if outdir.exists():
+    # Start from a clean directory, but leave a fresh (empty) tmpdir alone
+    if outdir.exists() and any(outdir.iterdir()):
         shutil.rmtree(outdir)
 
     print()
@@ -356,15 +382,18 @@ def check_content(outdir, content, msids=None):
 
     print(f"Checking {content} {msids}")
     for stat in None, "5min", "daily":
-        for msid in msids:
-            fetch.times_cache["key"] = None
-            with set_fetch_basedir(basedir_test):
-                dat_stub = fetch.Msid(msid, START, STOP, stat=stat)
-
-            fetch.times_cache["key"] = None
-            with set_fetch_basedir(basedir_ref):
-                dat_orig = fetch.Msid(msid, START, STOP, stat=stat)
-
+        # Fetch all MSIDs from each archive at once so that MSIDs of the content
+        # share the cached times.  The cache must be reset when changing archive.
+        fetch.times_cache["key"] = None
+        with set_fetch_basedir(basedir_test):
+            dats_stub = fetch.Msidset(msids, START, STOP, stat=stat)
+
+        fetch.times_cache["key"] = None
+        with set_fetch_basedir(basedir_ref):
+            dats_orig = fetch.Msidset(msids, START, STOP, stat=stat)
+
+        for msid, dat_orig in dats_orig.items():
+            dat_stub = dats_stub[msid]
             for attr in dat_orig.colnames:
                 assert np.all(getattr(dat_stub, attr) == getattr(dat_orig, attr))
 
@@ -3,7 +3,7 @@ import numpy as np
 
 from .. import fetch as fetch_cxc
 from .. import fetch_eng, fetch_sci
-from ..units import Units
+from ..units import C_to_F, F_to_C, F_to_K, FASTEP_to_mm, K_to_F, Units
 
 start = "2011:001:00:00:00"
 stop = "2011:001:00:30:00"
@@ -93,6 +93,19 @@ def test_from_units():
     assert np.allclose(vals, [0.0])
 
 
+def test_convert_same_system():
+    vals = np.array([32.0])
+    assert Units("eng").convert("TEPHIN", vals, from_system="eng") is vals
+    assert Units("cxc").convert("TEPHIN", vals) is vals
+
+
+def test_fastep_to_mm_int_vals():
+    """Integer steps convert the same as float (no overflow in high powers)"""
+    vals = np.array([-5000, -1234, 0, 1000])
+    assert np.allclose(FASTEP_to_mm(vals), FASTEP_to_mm(vals.astype(float)))
+    assert np.allclose(FASTEP_to_mm(-1234.0), -1.7686582299507132)
+
+
 def test_equiv_units():
     cxc = fetch_cxc.MSID("aorate1", start, stop)
     sci = fetch_sci.MSID("aorate1", start, stop)
@@ -105,6 +118,19 @@ def test_equiv_units():
 def test_unit_name_value_types():
     for system in ("eng", "cxc", "sci"):
         units = fetch_cxc.Units()[system]
-        for name, value in units.items():
-            assert type(name) is str
-            assert type(value) is str
+        bad_items = [
+            (name, value)
+            for name, value in units.items()
+            if type(name) is not str or type(value) is not str
+        ]
+        assert bad_items == []
+
+
+def test_temperature_conversions_keep_input():
+    vals = np.array([0.0, 273.15, 373.15])
+    assert np.allclose(K_to_F(vals), [-459.67, 32.0, 212.0])
+    assert np.allclose(F_to_K(K_to_F(vals)), vals)
+    assert np.allclose(C_to_F(vals - 273.15), [-459.67, 32.0, 212.0])
+    assert np.allclose(F_to_C(C_to_F(vals)), vals)
+    assert np.all(vals == [0.0, 273.15, 373.15])
+    assert np.isclose(K_to_F(273.15), 32.0)
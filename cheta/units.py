@@ -94,14 +94,18 @@ def F_to_C(vals, delta_val=False):
     if delta_val:
         return vals / 1.8
     else:
-        return (vals - 32.0) / 1.8
+        out = vals - 32.0
+        out /= 1.8
+        return out
 
 
 def C_to_F(vals, delta_val=False):
     if delta_val:
         return vals * 1.8
     else:
-        return vals * 1.8 + 32
+        out = vals * 1.8
+        out += 32
+        return out
 
 
 def C_to_K(vals, delta_val=False):
@@ -122,28 +126,62 @@ def K_to_F(vals, delta_val=False):
     if delta_val:
         return vals * 1.8
     else:
-        return vals * 1.8 - 459.67  # (vals - 273.15) * 1.8 + 32
+        # (vals - 273.15) * 1.8 + 32, updating the product in place
+        out = vals * 1.8
+        out -= 459.67
+        return out
 
 
 def F_to_K(vals, delta_val=False):
     if delta_val:
         return vals / 1.8
     else:
-        return (vals + 459.67) / 1.8
+        out = vals + 459.67
+        out /= 1.8
+        return out
+
+
+# Calibration polynomials for the focus assembly (FASTEP <=> mm), highest
+# power first for np.polyval
+FASTEP_TO_MM_COEFFS = np.array(
+    [
+        1.020064e-25,
+        5.29336e-21,
+        3.9803832e-17,
+        -1.08492544e-12,
+        3.5723322e-8,
+        1.47906994e-3,
+        0.0,
+    ]
+)
+MM_TO_FASTEP_COEFFS = np.array(
+    [
+        -1.26507734e-05,
+        -2.02499464e-04,
+        -1.86504522e-03,
+        -5.25689124e-03,
+        -5.75639912e-02,
+        5.60935786e-01,
+        -1.10595209e01,
+        6.76094720e02,
+        -4.34121454e-04,
+    ]
+)
 
 
 def FASTEP_to_mm(vals, delta_val=False):
     """
     Use CXC calibration value to convert from focus assembly steps to mm.
+
+    The calibration polynomial is::
+
+      1.47906994e-3 * x + 3.5723322e-8 * x**2 + -1.08492544e-12 * x**3
+      + 3.9803832e-17 * x**4 + 5.29336e-21 * x**5 + 1.020064e-25 * x**6
+
+    This is evaluated with np.polyval (Horner's method) to avoid computing each
+    power of ``vals`` as a separate array.
     """
-    fastep = (
-        1.47906994e-3 * vals
-        + 3.5723322e-8 * vals**2
-        + -1.08492544e-12 * vals**3
-        + 3.9803832e-17 * vals**4
-        + 5.29336e-21 * vals**5
-        + 1.020064e-25 * vals**6
-    )
+    fastep = np.polyval(FASTEP_TO_MM_COEFFS, vals)
     return fastep
 
 
@@ -156,20 +194,7 @@ def mm_to_FASTEP(vals, delta_val=False):
          3.9803832e-17  *   x**4 +  5.29336e-21  *  x**5 +  1.020064e-25  *   x**6)
     r = np.polyfit(y, x, 8)
     """
-    r = np.array(
-        [
-            -1.26507734e-05,
-            -2.02499464e-04,
-            -1.86504522e-03,
-            -5.25689124e-03,
-            -5.75639912e-02,
-            5.60935786e-01,
-            -1.10595209e01,
-            6.76094720e02,
-            -4.34121454e-04,
-        ]
-    )
-    x_step = np.round(np.polyval(r, vals), decimals=2)
+    x_step = np.round(np.polyval(MM_TO_FASTEP_COEFFS, vals), decimals=2)
     return x_step
 
 
@@ -241,10 +266,9 @@ def get_msid_unit(msid):
 def convert(msid, vals, delta_val=False):
     MSID = msid.upper()
     conversion = (units["cxc"].get(MSID), get_msid_unit(MSID))
-    try:
-        vals = converters[conversion](vals, delta_val)
-    except KeyError:
-        pass
+    converter = converters.get(conversion)
+    if converter is not None:
+        vals = converter(vals, delta_val)
     return vals
 
 
@@ -293,6 +317,10 @@ class Units(dict):
         return system_unit
 
     def convert(self, msid, vals, delta_val=False, from_system="cxc"):
+        # Converting within the current system is always the identity
+        if from_system == self["system"]:
+            return vals
+
         MSID = msid.upper()
         conversion = (self[from_system].get(MSID), self.get_msid_unit(MSID))
 
@@ -238,15 +238,14 @@ def _pad_long_gaps(times, bools, max_gap):
     dts = np.diff(times)
     i_long_gaps = np.flatnonzero(dts > max_gap)
     if len(i_long_gaps) > 0:
-        for i in i_long_gaps[::-1]:
-            times = np.concatenate(
-                [
-                    times[: i + 1],
-                    [times[i] + max_gap / 2.0, times[i + 1] - max_gap / 2.0],
-                    times[i + 1 :],
-                ]
-            )
-            bools = np.concatenate([bools[: i + 1], [False, False], bools[i + 1 :]])
+        # Insert a pair of fictitious False samples into every long gap in a single
+        # pass, at ``max_gap / 2`` from the data values on either side of the gap.
+        idxs = np.repeat(i_long_gaps + 1, 2)
+        pad_times = np.empty(len(idxs), dtype=times.dtype)
+        pad_times[0::2] = times[i_long_gaps] + max_gap / 2.0
+        pad_times[1::2] = times[i_long_gaps + 1] - max_gap / 2.0
+        times = np.insert(times, idxs, pad_times)
+        bools = np.insert(bools, idxs, False)
     return times, bools
 
 
@@ -398,9 +397,11 @@ def state_intervals(times, vals, start=None, stop=None):
         if stop is not None:
             state_times = state_times.clip(None, stop.secs)
 
+        # Format each transition time once since interval stops are the next starts.
+        state_dates = CxoTime(state_times).date
         intervals = {
-            "datestart": CxoTime(state_times[:-1]).date,
-            "datestop": CxoTime(state_times[1:]).date,
+            "datestart": state_dates[:-1],
+            "datestop": state_dates[1:],
             "tstart": state_times[:-1],
             "tstop": state_times[1:],
             "duration": state_times[1:] - state_times[:-1],
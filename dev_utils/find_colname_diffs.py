@@ -8,8 +8,8 @@ for content_dir in content_dirs:
     f1 = os.path.join(root, content_dir, "colnames.pickle")
     f2 = os.path.join(root, content_dir, "colnames_all.pickle")
     if os.path.exists(f1) and os.path.exists(f2):
-        colnames = pickle.load(open(f1))
-        colnames_all = pickle.load(open(f2))
+        colnames = pickle.load(open(f1, "rb"))
+        colnames_all = pickle.load(open(f2, "rb"))
         diff = colnames_all - colnames - set(["QUALITY"])
         if diff:
             print(content_dir)
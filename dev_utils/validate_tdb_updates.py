@@ -9,12 +9,15 @@ from matplotlib import pyplot as plt
 from cheta import fetch_eng as fetch
 
 for content in os.listdir("data"):
-    new_colnames = pickle.load(open(os.path.join("data", content, "colnames.pickle")))
+    new_colnames = pickle.load(
+        open(os.path.join("data", content, "colnames.pickle"), "rb")
+    )
     cur_colnames = pickle.load(
         open(
             os.path.join(
                 "/proj/sot/ska/data/eng_archive", "data", content, "colnames.pickle"
-            )
+            ),
+            "rb",
         )
     )
     print("New {}".format(content))
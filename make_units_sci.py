@@ -6,7 +6,7 @@ are in degC instead of Kelvins.  Otherwise leave the CXC units untouched.
 
 import pickle
 
-units_cxc = pickle.load(open("units_cxc.pkl"))
+units_cxc = pickle.load(open("units_cxc.pkl", "rb"))
 units_sci = dict(
     (msid, "DEGC") for msid, unit in units_cxc.items() if unit in ("K", "deltaK")
 )